@@ -3,7 +3,7 @@
 This script reads in a Word file (.docx) with source descriptions 
 and converts it to to a JSON file (.json).
 
-This script requires that `bs4` (BeautifulSoup) and `mammoth` be installed within the Python
+This script requires that `bs4` (BeautifulSoup), `lxml` and `mammoth` be installed within the Python
 environment you are running this script in. It also requires the `utils.py` file with the 
 `ConversionUtils` class to be in the same directory.
 
@@ -47,17 +47,19 @@ The script expects a Word file input structured in the following way:
 """
 
 import argparse
+from typing import Optional
 
 from bs4 import BeautifulSoup
 from utils import ConversionUtils
 
 
-def convert_source_description(directory: str, file_name: str):
+def convert_source_description(directory: str, file_name: str, cache_dir: Optional[str] = None):
     """Convert a source description from Word to JSON.
 
     Args:
         directory (str): The directory where the Word file is located.
         inputFile (str): The Word file to extract the source description from.
+        cache_dir (Optional[str]): The directory to cache the HTML of the Word file in.
 
     Returns
         A JSON file with the source description.
@@ -66,21 +68,24 @@ def convert_source_description(directory: str, file_name: str):
     # Define file path
     file_path = directory + file_name
 
+    # Use a single instance, so that the parsed document is only indexed once
+    conversion_utils = ConversionUtils()
+
     # Get HTML from Word file
-    html = ConversionUtils().read_html_from_word_file(file_path)
+    html = conversion_utils.read_html_from_word_file(file_path, cache_dir)
 
     # Parse HTML
-    soup = BeautifulSoup(html, 'html.parser')
+    soup = BeautifulSoup(html, 'lxml')
 
     # Create the full sourceList object
-    source_list = ConversionUtils().create_source_list(soup)
+    source_list = conversion_utils.create_source_list(soup)
 
     # Create the full textcritics object
-    textcritics = ConversionUtils().create_textcritics(soup)
+    textcritics = conversion_utils.create_textcritics(soup)
 
     # Output
-    ConversionUtils().write_json(source_list, file_path + '_source-description')
-    ConversionUtils().write_json(textcritics, file_path + '_textcritics')
+    conversion_utils.write_json(source_list, file_path + '_source-description')
+    conversion_utils.write_json(textcritics, file_path + '_textcritics')
 
 
 def main():
@@ -96,8 +101,15 @@ def main():
         type=str,
         help="The Word file to extract the source description from (without the .docx extension)."
     )
+    parser.add_argument(
+        '--cache-dir',
+        type=str,
+        default=None,
+        help="A directory to cache the HTML of the Word file in "
+             "(reused while the file is unchanged; outdated cache files are not removed)."
+    )
     args = parser.parse_args()
-    convert_source_description(args.directory, args.file_name)
+    convert_source_description(args.directory, args.file_name, args.cache_dir)
 
 
 if __name__ == "__main__":
@@ -3,14 +3,16 @@
 This module should not be run directly. Instead, run the `convert_source_description.py` module.
 """
 
-import copy
+import functools
 import json
 import os
 import re
-from typing import Dict, List, NotRequired, Optional, TypedDict
+import tempfile
+from importlib import metadata
+from typing import Dict, List, NotRequired, Optional, Tuple, TypedDict, Union
 
 import mammoth
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, NavigableString, Tag
 
 
 ############################################
@@ -120,6 +122,41 @@ SYSTEM_STR = 'System'
 MEASURE_STR = 'T.'
 FOLIO_STR = 'Bl.'
 
+# Version of mammoth, part of the HTML cache key (different versions may generate different HTML)
+try:
+    MAMMOTH_VERSION = metadata.version('mammoth')
+except metadata.PackageNotFoundError:
+    MAMMOTH_VERSION = 'unknown'
+
+# Translation table to create item ids from item labels (spaces and dots become underscores)
+ITEM_LINK_TRANSLATION = str.maketrans(' .', '__')
+
+# Labels of the paragraphs with the description of a source,
+# mapped to the field of the description they are stored in
+DESCRIPTION_LABELS = {
+    'Beschreibstoff:': 'writingMaterial',
+    'Schreibstoff:': 'writingInstruments',
+    'Titel:': 'title',
+    'Datierung:': 'date',
+    'Paginierung:': 'pagination',
+    'Taktzahlen:': 'measureNumbers',
+    'Besetzung:': 'instrumentation',
+    'Eintragungen:': 'annotations'
+}
+
+# Labels of the paragraphs that start the content and the comments sections
+CONTENT_LABEL = 'Inhalt:'
+COMMENTS_LABEL = 'Textkritischer Kommentar:'
+
+########
+# Pattern for a single siglum with optional addition, like A or Ac
+SIGLUM_PATTERN = re.compile(r'([A-Z])([a-z])?')
+
+# Pattern for row labels, matches, e.g., "Gg (1)", "KUgis (38)",
+# or "Gg (I)", "KUgis (XXXVIII)", but also "Gg", "KUgis"
+ROW_PATTERN = re.compile(
+    r"([A-Z]{1,2})([a-z]{1,3})(?:\s\((\d{1,2}|[IVXL]{1,7})\))?")
+
 ########
 emptySourceList: SourceList = {
     "sources": []
@@ -202,6 +239,106 @@ emptyLinkBox: LinkBox = {
     "linkTo": ""
 }
 
+############################################
+# Helper functions: Empty object factories
+############################################
+# The empty objects above document the expected shape of the output objects.
+# The factories below create fresh instances of them (much cheaper than `copy.deepcopy`).
+
+
+def _new_source_list() -> SourceList:
+    """Creates a new, empty SourceList object."""
+    return {"sources": []}
+
+
+def _new_source_description() -> SourceDescription:
+    """Creates a new, empty SourceDescription object."""
+    return {
+        "id": "",
+        "siglum": "",
+        "siglumAddendum": "",
+        "type": "",
+        "location": "",
+        "description": {}
+    }
+
+
+def _new_description() -> Description:
+    """Creates a new, empty Description object."""
+    return {
+        "desc": [],
+        "writingMaterial": "",
+        "writingInstruments": {
+            "main": "",
+            "secondary": []
+        },
+        "title": "",
+        "date": "",
+        "pagination": "",
+        "measureNumbers": "",
+        "instrumentation": "",
+        "annotations": "",
+        "content": []
+    }
+
+
+def _new_content_item() -> ContentItem:
+    """Creates a new, empty ContentItem object."""
+    return {
+        "item": "",
+        "itemLinkTo": "",
+        "itemDescription": "",
+        "folios": []
+    }
+
+
+def _new_folio() -> Folio:
+    """Creates a new, empty Folio object."""
+    return {
+        "folio": "",
+        "folioLinkTo": "",
+        "folioDescription": "",
+        "systemGroups": []
+    }
+
+
+def _new_system() -> System:
+    """Creates a new, empty System object."""
+    return {
+        "system": "",
+        "measure": "",
+        "linkTo": ""
+    }
+
+
+def _new_textcritics_list() -> TextcriticsList:
+    """Creates a new, empty TextcriticsList object."""
+    return {"textcritics": []}
+
+
+def _new_textcritics() -> TextCritics:
+    """Creates a new, empty TextCritics object."""
+    return {
+        "id": "",
+        "label": "",
+        "description": [],
+        # "rowTable": False,
+        "comments": [],
+        "linkBoxes": []
+    }
+
+
+def _new_textcritical_comment() -> TextcriticalComment:
+    """Creates a new, empty TextcriticalComment object."""
+    return {
+        "svgGroupId": "TODO",
+        "measure": "",
+        "system": "",
+        "position": "",
+        "comment": ""
+    }
+
+
 ############################################
 # Public class: ConversionUtils
 ############################################
@@ -211,6 +348,12 @@ class ConversionUtils:
     """A class that contains utility functions for the conversion of source descriptions 
         from Word to JSON."""
 
+    def __init__(self) -> None:
+        """Initializes the cache for the indexed document."""
+        self._indexed_soup: Optional[BeautifulSoup] = None
+        self._indexed_paras: List[Tag] = []
+        self._indexed_tables: List[Tag] = []
+
     ############################################
     # Public class function: create_source_list
     ############################################
@@ -224,11 +367,14 @@ class ConversionUtils:
         Returns:
             A SourceList object containing a list of SourceDescription objects.
         """
-        source_list = copy.deepcopy(emptySourceList)
+        source_list = _new_source_list()
         sources = source_list['sources']
 
+        # Index of every siglum in sources, to find duplicates without a linear search
+        siglum_positions: Dict[str, int] = {}
+
         # Find all p tags in soup
-        paras = soup.find_all('p')
+        paras, _ = self._index_document(soup)
 
         # Find all siglum indices
         siglum_indices = _find_siglum_indices(paras)
@@ -244,16 +390,16 @@ class ConversionUtils:
             source_description = _create_source_description(filtered_paras)
             siglum = source_description['siglum']
 
-            try:
-                source = next(
-                    source for source in sources if source['siglum'] == siglum)
+            siglum_position = siglum_positions.get(siglum)
+            if siglum_position is not None:
                 print(
                     f"Source description for {siglum} already included. "
                     f"Overwriting with latest changes...")
-                source.update(source_description)
-            except StopIteration:
+                sources[siglum_position].update(source_description)
+            else:
                 print(
                     f"Appending source description for {siglum}...")
+                siglum_positions[siglum] = len(sources)
                 sources.append(source_description)
 
         return source_list
@@ -271,36 +417,72 @@ class ConversionUtils:
         Returns:
             A SourceList object containing a list of SourceDescription objects.
         """
-        textcritics_list = copy.deepcopy(emptyTextcriticsList)
+        textcritics_list = _new_textcritics_list()
+        textcritics_entries = textcritics_list['textcritics']
 
         # Find all table tags in soup
-        tables = soup.find_all('table')
+        _, tables = self._index_document(soup)
 
         # Iterate over tables and create textcritics
         for table_index, table in enumerate(tables):
-            textcritics = copy.deepcopy(emptyTextcritics)
+            textcritics = _new_textcritics()
+            comments = textcritics['comments']
 
             table_rows = table.find_all('tr')
             for row in table_rows[1:]:
-                comment = copy.deepcopy(emptyTextcriticalComment)
-                table_cols = row.find_all('td')
-                comment['measure'] = _strip_tag(
-                    _strip_tag(table_cols[0], 'td'), 'p')
-                comment['system'] = _strip_tag(
-                    _strip_tag(table_cols[1], 'td'), 'p')
-                comment['position'] = _strip_tag(
-                    _strip_tag(table_cols[2], 'td'), 'p')
-                comment['comment'] = _strip_tag(
-                    _strip_tag(table_cols[3], 'td'), 'p')
-
-                textcritics['comments'].append(comment)
+                # Only direct children are relevant, so no need for a full find_all search
+                table_cols = [
+                    col for col in row.children if isinstance(col, Tag) and col.name == 'td']
+                if len(table_cols) < 4:
+                    print('Skipping table row with less than 4 columns:', row)
+                    continue
+
+                comment = _new_textcritical_comment()
+                comment['measure'] = _get_cell_content(table_cols[0])
+                comment['system'] = _get_cell_content(table_cols[1])
+                comment['position'] = _get_cell_content(table_cols[2])
+                comment['comment'] = _get_cell_content(table_cols[3])
+
+                comments.append(comment)
 
             print(
                 f"Appending textcritics for table {table_index + 1}...")
-            textcritics_list['textcritics'].append(textcritics)
+            textcritics_entries.append(textcritics)
 
         return textcritics_list
 
+    ############################################
+    # Private class function: _index_document
+    ############################################
+    def _index_document(self, soup: BeautifulSoup) -> Tuple[List[Tag], List[Tag]]:
+        """
+        Collects all p and table tags of the given soup in a single tree walk.
+        The result is cached, so that the soup is only traversed once
+        when both source list and textcritics are created from it.
+
+        Args:
+            soup (BeautifulSoup): A BeautifulSoup object representing the document.
+
+        Returns:
+            A tuple with the list of all p tags and the list of all table tags in document order.
+        """
+        if soup is not self._indexed_soup:
+            paras = []
+            tables = []
+            for element in soup.descendants:
+                if not isinstance(element, Tag):
+                    continue
+                if element.name == 'p':
+                    paras.append(element)
+                elif element.name == 'table':
+                    tables.append(element)
+
+            self._indexed_soup = soup
+            self._indexed_paras = paras
+            self._indexed_tables = tables
+
+        return self._indexed_paras, self._indexed_tables
+
     ############################################
     # Public class function: pprint
     ############################################
@@ -321,12 +503,18 @@ class ConversionUtils:
     # Public class function: read_html_from_word_file
     ############################################
 
-    def read_html_from_word_file(self, file_path: str) -> str:
+    def read_html_from_word_file(self, file_path: str, cache_dir: Optional[str] = None) -> str:
         """
         Reads a Word file in .docx format and returns its content as an HTML string.
 
+        If a cache directory is given, the generated HTML is stored there and reused
+        as long as modification time and size of the Word file and the mammoth version
+        do not change. Outdated cache files are not removed.
+
         Args:
             filePath (str): The name of the Word file to be read, without the .docx extension.
+            cache_dir (Optional[str]): The directory to cache the generated HTML in.
+                Defaults to None (no caching).
 
         Returns:
             str: The content of the Word file as an HTML string.
@@ -335,14 +523,42 @@ class ConversionUtils:
         if not os.path.exists(source_file_name):
             raise FileNotFoundError("File not found: " + file_path + ".docx")
 
+        # Check cache for HTML of an unchanged Word file
+        cache_file_name = None
+        if cache_dir is not None:
+            source_stat = os.stat(source_file_name)
+            cache_key = (f"{os.path.basename(file_path)}_"
+                         f"{source_stat.st_mtime_ns}_{source_stat.st_size}_"
+                         f"mammoth-{MAMMOTH_VERSION}")
+            cache_file_name = os.path.join(cache_dir, cache_key + ".html")
+            if os.path.exists(cache_file_name):
+                with open(cache_file_name, "r", encoding='utf-8') as cache_file:
+                    return cache_file.read()
+
         with open(source_file_name, "rb") as source_file:
             try:
                 result = mammoth.convert_to_html(source_file)
-                return result.value  # The generated HTML
             except ValueError as error:
                 raise ValueError('Error converting file: ' +
                                  str(error)) from error
 
+        html = result.value  # The generated HTML
+
+        if cache_file_name is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write to a temporary file first and move it into place,
+            # so that an interrupted write never leaves a truncated cache file
+            temp_fd, temp_file_name = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            try:
+                with os.fdopen(temp_fd, "w", encoding='utf-8') as temp_file:
+                    temp_file.write(html)
+                os.replace(temp_file_name, cache_file_name)
+            except BaseException:
+                os.remove(temp_file_name)
+                raise
+
+        return html
+
     ############################################
     # Public class function: write_json
     ############################################
@@ -357,15 +573,13 @@ class ConversionUtils:
         Returns:
             None
         """
-        # Serializing json
-        json_object = json.dumps(data, indent=4, ensure_ascii=False).encode(
-            'utf8').decode('utf8')
-
-        # Writing to target file
+        # Serializing json directly to target file
+        # (json.dump writes many small chunks, so use a large buffer to batch them)
         target_file_name = file_path + ".json"
         try:
-            with open(target_file_name, "w", encoding='utf-8') as target_file:
-                target_file.write(json_object)
+            with open(target_file_name, "w", encoding='utf-8',
+                      buffering=1024 * 1024) as target_file:
+                json.dump(data, target_file, indent=4, ensure_ascii=False)
             print(f"Data written to {target_file_name} successfully.")
         except IOError:
             print(f"Error writing data to {target_file_name}.")
@@ -383,50 +597,43 @@ def _create_source_description(paras: List[Tag]) -> SourceDescription:
     Returns:
         SourceDescription: A dictionary representing the source description.
     """
+    # Get text content of all paras only once
+    para_texts = [para.get_text() for para in paras]
+
     # Get siglum, id, type, and location
-    siglum = paras[0].text.strip() or ''
+    siglum = para_texts[0].strip() or ''
     source_id = 'source_' + siglum if siglum else ''
-    source_type = paras[1].text.strip() or ''
-    location = paras[2].text.strip() or ''
+    source_type = para_texts[1].strip() or ''
+    location = para_texts[2].strip() or ''
 
-    source_description = copy.deepcopy(emptySourceDescription)
+    source_description = _new_source_description()
     source_description['id'] = source_id
     source_description['siglum'] = siglum
     source_description['type'] = source_type
     source_description['location'] = location
 
     # Get description
-    description = copy.deepcopy(emptyDescription)
-    desc = paras[3].text.strip() or ''
+    description = _new_description()
+    desc = para_texts[3].strip() or ''
     description['desc'].append(desc)
 
-    # Get writing material and instruments
-    writing_material = _get_paragraph_content_by_label(
-        'Beschreibstoff:', paras)
-    writing_instruments_content = _get_paragraph_content_by_label(
-        'Schreibstoff:', paras)
-    writing_instruments = _extract_writing_instruments(
-        writing_instruments_content)
-
-    description['writingMaterial'] = writing_material
-    description['writingInstruments'] = writing_instruments
-
-    # Get title, date, measureNumbers, instrumentation, and annotations
-    description['title'] = _get_paragraph_content_by_label('Titel:', paras)
-    description['date'] = _get_paragraph_content_by_label('Datierung:', paras)
-    description['pagination'] = _get_paragraph_content_by_label(
-        'Paginierung:', paras)
-    description['measureNumbers'] = _get_paragraph_content_by_label(
-        'Taktzahlen:', paras)
-    description['instrumentation'] = _get_paragraph_content_by_label(
-        'Besetzung:', paras)
-    description['annotations'] = _get_paragraph_content_by_label(
-        'Eintragungen:', paras)
+    # Find the paragraphs of all description and section labels in a single pass
+    label_indices = _find_label_indices(
+        tuple(DESCRIPTION_LABELS) + (CONTENT_LABEL, COMMENTS_LABEL), para_texts)
+
+    # Get writing material, writing instruments, title, date, pagination,
+    # measureNumbers, instrumentation, and annotations
+    for label, field in DESCRIPTION_LABELS.items():
+        content = _get_paragraph_content_by_label(label, paras, label_indices)
+        if field == 'writingInstruments':
+            description[field] = _extract_writing_instruments(content)
+        else:
+            description[field] = content
 
     # Get content items
-    content_index = _get_paragraph_index_by_label('Inhalt:', paras)
+    content_index = _get_paragraph_index_by_label(CONTENT_LABEL, label_indices)
     comments_index = _get_paragraph_index_by_label(
-        'Textkritischer Kommentar:', paras) or len(paras) - 1
+        COMMENTS_LABEL, label_indices) or len(paras) - 1
 
     description['content'] = _get_items(
         paras[(content_index + 1):comments_index])
@@ -455,27 +662,45 @@ def _extract_writing_instruments(writing_instruments_text: str) -> WritingInstru
     # Default value for empty writing instruments
     writing_instruments = {'main': '', 'secondary': []}
     if writing_instruments_text is not None:
-        stripped_writing_instruments = _strip_by_delimiter(
-            writing_instruments_text, ';')
-
-        # Strip . from last main and secondary writing instruments
-        main = stripped_writing_instruments[0].strip().rstrip('.')
-        if len(stripped_writing_instruments) > 1:
-            secondary = [instr.strip().rstrip('.')
-                         for instr in _strip_by_delimiter(stripped_writing_instruments[1], ',')]
-        else:
-            secondary = []
-        writing_instruments = {'main': main, 'secondary': secondary}
+        # Build a new dictionary from the cached (immutable) result,
+        # so that the cache cannot be modified by callers
+        main, secondary = _parse_writing_instruments(writing_instruments_text)
+        writing_instruments = {'main': main, 'secondary': list(secondary)}
     return writing_instruments
 
 
+############################################
+# Helper function: _find_label_indices
+############################################
+def _find_label_indices(labels: Tuple[str, ...], para_texts: List[str]) -> Dict[str, int]:
+    """
+    Searches for multiple labels in a list of paragraph texts in a single pass.
+
+    Args:
+      labels (Tuple[str, ...]): The labels to search for.
+      para_texts (List[str]): The list of paragraph texts to search within.
+
+    Returns:
+      A dictionary mapping every found label to the index of the first paragraph text
+      containing it. Labels that are not found are not included.
+    """
+    label_indices = {}
+    for index, para_text in enumerate(para_texts):
+        for label in labels:
+            if label not in label_indices and label in para_text:
+                label_indices[label] = index
+        if len(label_indices) == len(labels):
+            break
+    return label_indices
+
+
 ############################################
 # Helper function: _find_siblings
 ############################################
 def _find_siblings(sibling_para: Tag, paras: List[Tag]) -> List[Tag]:
     """
-    Recursively finds all sibling paragraphs in a given list of paragraphs
-    and finishes the recursion if the paragraph contains a <strong> tag or ends with a period.
+    Iteratively finds all sibling paragraphs in a given list of paragraphs
+    and stops the search if the paragraph contains a <strong> tag or ends with a period.
 
     Args:
         sibling_para (BeautifulSoup.Tag): The first sibling paragraph to start the search from.
@@ -484,17 +709,21 @@ def _find_siblings(sibling_para: Tag, paras: List[Tag]) -> List[Tag]:
     Returns:
         List[BeautifulSoup.Tag]: A list of all sibling paragraphs.
     """
-    # Check if the current paragraph contains a <strong> tag
-    if sibling_para.find('strong'):
-        return paras
-    # Check if the current paragraph ends with a period
-    elif sibling_para.text.endswith('.'):
-        paras.append(sibling_para)
-        return paras
-    # If the current paragraph does not meet the criteria, recursively search the next sibling
-    else:
+    while sibling_para is not None:
+        # Stop if the current paragraph contains a <strong> tag
+        if sibling_para.find('strong'):
+            break
+
         paras.append(sibling_para)
-        return _find_siblings(sibling_para.next_sibling, paras)
+
+        # Stop if the current paragraph ends with a period
+        if sibling_para.text.endswith('.'):
+            break
+
+        # If the current paragraph does not meet the criteria, continue with the next sibling
+        sibling_para = sibling_para.next_sibling
+
+    return paras
 
 
 ############################################
@@ -512,40 +741,35 @@ def _find_siglum_indices(paras: List[Tag]) -> List[int]:
         A list of integers representing the indices of the paragraphs
             that contain a single bold siglum.
     """
-    # pattern for bold formatted single siglum with optional addition, like A or Ac
-    siglum_pattern = re.compile(
-        r'^<p><strong>([A-Z])([a-z])?</strong></p>$')
-
     siglum_indices = []
 
     for index, para in enumerate(paras):
-        # if para contains the pattern for a siglum
-        if siglum_pattern.match(str(para)):
+        # if para contains only a bold formatted siglum
+        if _is_siglum_paragraph(para):
             siglum_indices.append(index)
 
     return siglum_indices
 
 
 ############################################
-# Helper function: _find_tag_with_label_in_soup
+# Helper function: _get_cell_content
 ############################################
-def _find_tag_with_label_in_soup(label: str, paras: List[Tag]) -> Optional[Tag]:
+def _get_cell_content(cell: Tag) -> str:
     """
-    Searches for a specific label in a list of BeautifulSoup tags.
+    Gets the content of a table cell without the wrapping `td` and `p` tags.
 
     Args:
-      label (str): The label to search for.
-      paras (List[Tag]): The list of BeautifulSoup tags to search within.
+        cell (Tag): A BeautifulSoup `Tag` object representing a table cell.
 
     Returns:
-      The BeautifulSoup.Tag with the specified label, or None if not found.
+        str: The content of the table cell, with leading and trailing whitespace removed.
     """
-    if not label:
-        return None
-    for para in paras:
-        if para.find(string=re.compile(label)):
-            return para
-    return None
+    # The common case of a single child (usually a single paragraph)
+    # can be stripped without serializing the whole cell first
+    if len(cell.contents) == 1 and isinstance(cell.contents[0], Tag):
+        return _strip_tag(cell.contents[0], 'p')
+
+    return _strip_tag(cell.decode_contents().strip(), 'p')
 
 
 ############################################
@@ -562,14 +786,11 @@ def _get_folio_label(stripped_para_text: str, folio_str: str) -> str:
     Returns:
         str: The extracted folio label if found in the paragraph text, otherwise an empty string.
     """
-    folio_label = ''
-
-    if folio_str in stripped_para_text:
-        folio_label = stripped_para_text.lstrip('\t')
-        folio_label = folio_label.replace(folio_str + '\xa0', '').strip()
-        folio_label = folio_label.replace(folio_str, '').strip()
+    if folio_str not in stripped_para_text:
+        return ''
 
-    return folio_label
+    # strip() also removes tabs and non-breaking spaces (\xa0) around the label
+    return stripped_para_text.replace(folio_str + '\xa0', '').replace(folio_str, '').strip()
 
 
 ############################################
@@ -588,15 +809,19 @@ def _get_folios(sibling_paras: List[Tag]) -> List[Folio]:
     folios = []
 
     for para in sibling_paras:
-        stripped_para_text = _strip_by_delimiter(para.text, ' \t')
-        if len(stripped_para_text) == 1:
-            stripped_para_text = _strip_by_delimiter(para.text, '\t')
+        # Get text content of para only once
+        para_text = para.text
+        has_folio_str = FOLIO_STR in para_text
+        has_system_str = SYSTEM_STR in para_text
+
+        # Split by space + tab if present, otherwise by tab only
+        delimiter = ' \t' if ' \t' in para_text else '\t'
+        stripped_para_text = _strip_by_delimiter(para_text, delimiter)
 
         # Check sibling paragraph for folioStr to create a new folio entry
-        has_folio_str = para.find(string=re.compile(FOLIO_STR))
         if has_folio_str:
             # Create folio object
-            folio = copy.deepcopy(emptyFolio)
+            folio = _new_folio()
 
             folio['folio'] = _get_folio_label(
                 stripped_para_text[0].strip(), FOLIO_STR)
@@ -607,7 +832,7 @@ def _get_folios(sibling_paras: List[Tag]) -> List[Folio]:
 
         # If there is no folioStr, but a systemStr,
         # add a new systemGroup to the folio's systemGroups
-        elif not has_folio_str and para.find(string=re.compile(SYSTEM_STR)):
+        elif has_system_str:
             folio['systemGroups'].append(_get_system_group(stripped_para_text))
 
     return folios
@@ -630,10 +855,10 @@ def _get_item(para: Tag) -> ContentItem:
 
     # Get content of para with inner tags
     para_content = _strip_tag(para, 'p')
-    stripped_para_content = _strip_by_delimiter(para_content, delimiter)
+    stripped_para_content = _strip_by_delimiter(para_content, delimiter, 2)
 
     # Get text content of para without inner tags
-    stripped_para_text = _strip_by_delimiter(para.text, delimiter)
+    stripped_para_text = _strip_by_delimiter(para.text, delimiter, 2)
 
     # Extract itemLabel
     item_label = stripped_para_text[0].strip()
@@ -645,7 +870,7 @@ def _get_item(para: Tag) -> ContentItem:
         item_link_to = 'SkRT'
     # In all other cases, link to the id created from the itemLabel
     else:
-        item_link_to = item_label.replace(' ', '_').replace('.', '_')
+        item_link_to = item_label.translate(ITEM_LINK_TRANSLATION)
 
     # Extract itemDescription
     # (re-add delimiter that was removed in the stripping action above; and remove trailing colon)
@@ -654,7 +879,7 @@ def _get_item(para: Tag) -> ContentItem:
     item_description = delimiter + stripped_para_content[1].strip().rstrip(':')
 
     # Create item object
-    item = copy.deepcopy(emptyContentItem)
+    item = _new_content_item()
     item['item'] = item_label or ''
     item['itemLinkTo'] = item_link_to or ''
     item['itemDescription'] = item_description or ''
@@ -702,7 +927,8 @@ def _get_items(paras: List[Tag]) -> List[ContentItem]:
 ############################################
 # Helper function: _get_paragraph_content_by_label
 ############################################
-def _get_paragraph_content_by_label(label: str, paras: List[Tag]) -> str:
+def _get_paragraph_content_by_label(label: str, paras: List[Tag],
+                                    label_indices: Dict[str, int]) -> str:
     """
     Returns the content of the paragraph containing the specified label 
     within the BeautifulSoup object. If the label is not found, an empty string is returned.
@@ -710,58 +936,64 @@ def _get_paragraph_content_by_label(label: str, paras: List[Tag]) -> str:
     Args:
         label (str): The label to search for within the BeautifulSoup object.
         paras (List[Tag]): The list of BeautifulSoup tags to search within.
+        label_indices (Dict[str, int]): The indices of the labelled paragraphs in `paras`,
+            as returned by `_find_label_indices`.
 
     Returns:
         str: The content of the BeautifulSoup `p` tag containing the label, 
              with leading and trailing whitespace removed.
     """
-    content_paragraph = _find_tag_with_label_in_soup(label, paras)
+    content_index = label_indices.get(label, -1)
 
-    if content_paragraph is None:
+    if content_index == -1:
         return ''
 
+    content_paragraph = paras[content_index]
     stripped_content = _strip_tag(content_paragraph, 'p')
-    content = _strip_by_delimiter(stripped_content, label)[1]
+    # Split at most twice: only the segment after the first label occurrence
+    # (up to a possible second one) is used
+    content_segments = _strip_by_delimiter(stripped_content, label, 2)
+    content = content_segments[1] if len(content_segments) > 1 else ''
 
     if content.endswith(';'):
         # Check for sibling paragraphs that belong to the same content
-        # (separated by semicolons)
+        # (separated by semicolons) and join them once at the end
+        content_parts = [content]
         sibling = content_paragraph.next_sibling
 
         while sibling is not None and sibling.name == 'p':
             sibling_content = _strip_tag(sibling, 'p')
             if sibling_content.endswith('.'):
-                content += '<br />' + sibling_content
+                content_parts.append(sibling_content)
                 break
             elif sibling_content.endswith(';'):
-                content += '<br />' + sibling_content
+                content_parts.append(sibling_content)
             else:
                 break
 
             sibling = sibling.next_sibling
 
+        content = '<br />'.join(content_parts)
+
     return content.strip()
 
 
 ############################################
 # Helper function: _get_paragraph_index_by_label
 ############################################
-def _get_paragraph_index_by_label(label: str, paras: List[Tag]) -> int:
+def _get_paragraph_index_by_label(label: str, label_indices: Dict[str, int]) -> int:
     """
     Gets the index of the first BeautifulSoup `p` element containing the specified label.
 
     Args:
         label (str): The label to search for.
-        paras (List[Tag]): The list of BeautifulSoup tags to search within.
+        label_indices (Dict[str, int]): The indices of the labelled paragraphs,
+            as returned by `_find_label_indices`.
 
     Returns:
         The index of the BeautifulSoup `p` tag containing the specified label, or -1 if not found.
     """
-    tag_with_label = _find_tag_with_label_in_soup(label, paras)
-    try:
-        return paras.index(tag_with_label)
-    except ValueError:
-        return -1
+    return label_indices.get(label, -1)
 
 
 ############################################
@@ -788,11 +1020,13 @@ def _get_system_group(stripped_para_text: List[str]) -> List[System]:
             continue
 
         # Create system object
-        system = copy.deepcopy(emptySystem)
+        system = _new_system()
 
         # Extract system label
         if SYSTEM_STR in para:
-            stripped_system_text = _strip_by_delimiter(para, ':')
+            # Split at most twice: only the segments before the first
+            # and between the first and second colon are used
+            stripped_system_text = _strip_by_delimiter(para, ':', 2)
             system_label = stripped_system_text[0].replace(
                 SYSTEM_STR, '').strip()
 
@@ -809,21 +1043,15 @@ def _get_system_group(stripped_para_text: List[str]) -> List[System]:
                 system['measure'] = measure_label
             else:
                 # Extract row label
-                # pattern matches, e.g., "Gg (1)", "KUgis (38)",
-                # or "Gg (I)", "KUgis (XXXVIII)",
-                # but also "Gg", "KUgis"
-                pattern = r"([A-Z]{1,2})([a-z]{1,3})(\s[(](\d{1,2}|[I,V,X,L]{1,7})[)])?"
+                row_match = ROW_PATTERN.search(stripped_system_text[1])
+                if row_match:
+                    row_type, row_base, row_number = row_match.groups()
 
-                if re.search(pattern, stripped_system_text[1]):
-                    row_text = re.findall(pattern, stripped_system_text[1])[0]
-
-                    row = copy.deepcopy(emptyRow)
-                    row['rowType'] = row_text[0]
-                    row['rowBase'] = row_text[1]
-                    if len(row_text) > 3:
-                        row['rowNumber'] = row_text[3]
-
-                    system['row'] = row
+                    system['row'] = {
+                        'rowType': row_type,
+                        'rowBase': row_base,
+                        'rowNumber': row_number or ''
+                    }
 
             system_group.append(system)
 
@@ -833,40 +1061,102 @@ def _get_system_group(stripped_para_text: List[str]) -> List[System]:
     return system_group
 
 
+############################################
+# Helper function: _is_siglum_paragraph
+############################################
+def _is_siglum_paragraph(para: Tag) -> bool:
+    """
+    Checks if a paragraph contains nothing but a single bold siglum,
+    i.e. `<p><strong>A</strong></p>`.
+    The check inspects the parse tree directly, so the paragraph does not need to be serialized.
+
+    Args:
+        para (Tag): A BeautifulSoup `Tag` object representing a paragraph.
+
+    Returns:
+        True if the paragraph contains only a bold siglum, otherwise False.
+    """
+    if para.attrs or len(para.contents) != 1:
+        return False
+
+    strong = para.contents[0]
+    if not isinstance(strong, Tag) or strong.name != 'strong' or strong.attrs:
+        return False
+    if len(strong.contents) != 1 or type(strong.contents[0]) is not NavigableString:
+        return False
+
+    return SIGLUM_PATTERN.fullmatch(strong.contents[0]) is not None
+
+
+############################################
+# Helper function: _parse_writing_instruments
+############################################
+@functools.lru_cache(maxsize=512)
+def _parse_writing_instruments(writing_instruments_text: str) -> Tuple[str, Tuple[str, ...]]:
+    """
+    Parses the main and secondary writing instruments from the given text.
+    The result is cached, because the same writing instruments
+    (e.g. "Bleistift.") are repeated across many source descriptions.
+
+    Args:
+        writing_instruments_text (str): The text to parse writing instruments from.
+
+    Returns:
+        A tuple with the main writing instrument and a tuple of secondary writing instruments.
+    """
+    stripped_writing_instruments = _strip_by_delimiter(
+        writing_instruments_text, ';')
+
+    # Strip . from last main and secondary writing instruments
+    main = stripped_writing_instruments[0].strip().rstrip('.')
+    if len(stripped_writing_instruments) > 1:
+        secondary = tuple(instr.strip().rstrip('.')
+                          for instr in _strip_by_delimiter(stripped_writing_instruments[1], ','))
+    else:
+        secondary = ()
+    return main, secondary
+
+
 ############################################
 # Helper function: _strip_by_delimiter
 ############################################
-def _strip_by_delimiter(input_str: str, delimiter: str) -> List[str]:
+def _strip_by_delimiter(input_str: str, delimiter: str, maxsplit: int = -1) -> List[str]:
     """
     Splits a string by a delimiter and returns a list of stripped substrings.
 
     Args:
         input_str (str): The input string to split and strip.
         delimiter (str): The delimiter to split the string by.
+        maxsplit (int): The maximum number of splits to do. Defaults to -1 (no limit).
 
     Returns:
         List[str]: A list of stripped substrings.
     """
     stripped_substring_list: List[str] = [
-        s.strip() for s in input_str.split(delimiter)]
+        s.strip() for s in input_str.split(delimiter, maxsplit)]
     return stripped_substring_list
 
 
 ############################################
 # Helper function: _strip_tag
 ############################################
-def _strip_tag(tag: Tag, tag_str: str) -> str:
+def _strip_tag(tag: Union[Tag, str], tag_str: str) -> str:
     """
     Strips opening and closing tags from an HTML/XML string and returns the
     content within the tags as a string.
 
     Args:
-      tag (Tag): The input BeautifulSoup tag.
+      tag (Union[Tag, str]): The input BeautifulSoup tag or HTML string.
       tagStr (str): The name of the tag to strip.
 
     Returns:
       str: The content within the specified tags, with leading and trailing whitespace removed.
     """
+    # For a tag of the given name, get its inner HTML directly
+    # instead of serializing the whole tag and stripping it again
+    if isinstance(tag, Tag) and tag.name == tag_str:
+        return tag.decode_contents().strip()
+
     stripped_str = str(tag) if tag is not None else ''
 
     # Strip opening and closing tags from input